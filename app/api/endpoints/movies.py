@@ -1,14 +1,38 @@
 import asyncio
-from fastapi import APIRouter, Query, Depends, HTTPException
+from fastapi import APIRouter, Query, Depends, HTTPException, Request, Response
 from fastapi_cache.decorator import cache
-from typing import List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict, Tuple
 from app.models.movie import Movie, MovieSearchResult, MovieType
 from app.services.movie_service import OMDBService, TMDBService, get_omdb_service, get_tmdb_service
 
 router = APIRouter()
 
+
+def search_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    Builds a readable cache key from the search parameters only, so the
+    injected service dependencies never end up in the key.
+    Providers and filters are case-insensitive, so values are normalized
+    to let equivalent queries share one cache entry.
+    """
+    title = (kwargs.get("title") or "").strip().lower()
+    movie_type = kwargs.get("type")
+    movie_type = movie_type.value if movie_type else ""
+    actor = (kwargs.get("actor") or "").strip().lower()
+    genre = (kwargs.get("genre") or "").strip().lower()
+    return f"{namespace}:mv:{title}:{movie_type}:{actor}:{genre}"
+
+
 @router.get("/search", response_model=MovieSearchResult)
-@cache(expire=3600)
+@cache(expire=3600, key_builder=search_key_builder)
 async def search_movies(
     title: Optional[str] = Query(None, min_length=2, description="Movie title to search for."),
     type: Optional[MovieType] = Query(None, description="Filter by type (movie or series)."),
@@ -23,16 +47,26 @@ async def search_movies(
     
     search_query = title if title else (actor or genre or "a")
 
-    omdb_task = omdb_service.search(search_query, movie_type=type)
-    tmdb_task = tmdb_service.search(search_query, movie_type=type)
+    omdb_task = asyncio.create_task(omdb_service.search(search_query, movie_type=type))
+    # Without a title, TMDB can list by genre directly instead of a text search.
+    tmdb_task = asyncio.create_task(tmdb_service.search(search_query, movie_type=type, genre=None if title else genre))
     results = await asyncio.gather(omdb_task, tmdb_task)
     
-    all_movies: Dict[str, Movie] = {movie.imdb_id: movie for sublist in results for movie in sublist if movie.imdb_id not in (all_movies := {})}
+    # First writer wins, so OMDB results take precedence over TMDB ones.
+    all_movies: Dict[str, Movie] = {}
+    for sublist in results:
+        for movie in sublist:
+            all_movies.setdefault(movie.imdb_id, movie)
     final_results = list(all_movies.values())
 
+    if not genre and not actor:
+        return MovieSearchResult(search_results=final_results, total_results=len(final_results), response=True)
+
     if genre:
-        final_results = [m for m in final_results if m.genres and any(g.lower() == genre.lower() for g in m.genres)]
+        genre_lc = genre.lower()
+        final_results = [m for m in final_results if m.genres and any(g.lower() == genre_lc for g in m.genres)]
     if actor:
-        final_results = [m for m in final_results if m.actors and any(a.lower() == actor.lower() for a in m.actors)]
+        actor_lc = actor.lower()
+        final_results = [m for m in final_results if m.actors and any(a.lower() == actor_lc for a in m.actors)]
 
     return MovieSearchResult(search_results=final_results, total_results=len(final_results), response=True)
@@ -5,6 +5,7 @@ from functools import lru_cache
 class Settings(BaseSettings):
     OMDB_API_KEY: str
     TMDB_API_KEY: str
+    REDIS_URL: str = "redis://localhost:6379"
     model_config = SettingsConfigDict(env_file='.env', env_file_encoding='utf-8')
 
 @lru_cache()
@@ -0,0 +1,35 @@
+import hishel
+from redis.exceptions import RedisError
+
+
+class FailSafeRedisStorage(hishel.AsyncRedisStorage):
+    """
+    Redis storage for the HTTP cache that never fails a request.
+    Redis errors are reported and treated as cache misses, so a cache
+    outage only costs extra calls to the external services.
+    """
+
+    async def retrieve(self, key):
+        try:
+            return await super().retrieve(key)
+        except RedisError as e:
+            print(f"HTTP cache read failed, treating as a miss: {e}")
+            return None
+
+    async def store(self, key, response, request, metadata=None):
+        try:
+            await super().store(key, response, request, metadata)
+        except RedisError as e:
+            print(f"HTTP cache write failed, response not cached: {e}")
+
+    async def update_metadata(self, key, response, request, metadata):
+        try:
+            await super().update_metadata(key, response, request, metadata)
+        except RedisError as e:
+            print(f"HTTP cache metadata update failed: {e}")
+
+    async def remove(self, key):
+        try:
+            await super().remove(key)
+        except RedisError as e:
+            print(f"HTTP cache removal failed: {e}")
@@ -0,0 +1,24 @@
+from redis import asyncio as aioredis
+
+# Wait this long (seconds) for a free pooled connection before giving up.
+POOL_TIMEOUT = 2
+# Socket timeouts (seconds), so a hung Redis fails fast instead of stalling requests.
+SOCKET_TIMEOUT = 1.0
+
+
+def create_redis_client(url: str, max_connections: int = 20) -> aioredis.Redis:
+    """
+    Creates a Redis client on a blocking connection pool.
+    Callers wait for a free connection instead of failing with
+    'Too many connections' once the pool is in use, and every
+    connect/read is bounded by a timeout.
+    """
+    pool = aioredis.BlockingConnectionPool.from_url(
+        url,
+        max_connections=max_connections,
+        timeout=POOL_TIMEOUT,
+        socket_connect_timeout=SOCKET_TIMEOUT,
+        socket_timeout=SOCKET_TIMEOUT,
+    )
+    # from_pool hands pool ownership to the client, so aclose() also closes the pool.
+    return aioredis.Redis.from_pool(pool)
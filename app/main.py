@@ -1,14 +1,21 @@
+import hishel
+import httpx
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.api.endpoints import movies
 from app.core.exceptions import ServiceUnavailable
 
 
 
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
 from fastapi_cache.decorator import cache
 
+from app.core.config import get_settings
+from app.core.http_cache import FailSafeRedisStorage
+from app.core.redis_client import create_redis_client
+from app.services.movie_service import OMDBService, TMDBService
+
 from contextlib import asynccontextmanager
 
 
@@ -17,24 +24,45 @@ from contextlib import asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Handles application startup and shutdown events.
-    Initializes the cache on startup and closes it on shutdown.
+    Initializes the cache, the shared HTTP client and the provider
+    services on startup and closes them on shutdown.
     """
-    FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
-    print("FastAPI Cache initialized 'In memory'")
+    settings = get_settings()
+    redis = create_redis_client(settings.REDIS_URL)
+    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+    print("FastAPI Cache initialized 'Redis'")
+    # One long-lived client for all outgoing calls so keep-alive connections
+    # (and TLS sessions) are reused instead of re-handshaking per request.
+    # Provider GET responses are also cached in Redis, keyed on the full URL.
+    # The HTTP cache owns its own Redis client, which it closes with the HTTP client.
+    http_cache_redis = create_redis_client(settings.REDIS_URL)
+    app.state.http = hishel.AsyncCacheClient(
+        storage=FailSafeRedisStorage(client=http_cache_redis, ttl=3600),
+        controller=hishel.Controller(cacheable_methods=["GET"], allow_stale=True, force_cache=True),
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(10.0, connect=3.0),
+    )
+    # Services only hold the API key and the shared client, so one instance each serves every request.
+    app.state.omdb = OMDBService(api_key=settings.OMDB_API_KEY, client=app.state.http)
+    app.state.tmdb = TMDBService(api_key=settings.TMDB_API_KEY, client=app.state.http)
     yield
+    await app.state.http.aclose()
     print("FastAPI Cache closing")
     FastAPICache.reset()
+    await redis.aclose()
 
 app = FastAPI(
     title="Movie Search API",
     description="An API to search for movies using multiple external providers. Made with love and FastAPI.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan 
 )
 
 @app.exception_handler(ServiceUnavailable)
 async def service_unavailable_exception_handler(request: Request, exc: ServiceUnavailable):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=503,
         content={
             "message": f"The external service '{exc.service_name}' is currently unavailable.",
@@ -1,5 +1,5 @@
 from enum import Enum
-from pydantic import BaseModel, Field, HttpUrl , ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from typing import Literal, List, Optional
 
 class MovieType(str, Enum):
@@ -19,14 +19,20 @@ class Movie(BaseModel):
     imdb_id: str = Field(..., description="The unique ID from IMDb.", alias="imdbID")  # imdbId -> camel case from their API  and we use snake_case here (alias)
     type: Literal['movie', 'series', 'episode', 'game'] = Field(..., description="The type of the content.", alias="Type")
     source_api: Literal['OMDB', 'TMDB'] = Field(..., description="The API source of this movie data.")
-    poster: Optional[HttpUrl] = Field(None, description="URL to the movie's poster image.", alias="Poster")
+    poster: Optional[str] = Field(None, description="URL to the movie's poster image.", alias="Poster")
     genres: Optional[List[str]] = Field(None, description="List of genres for the movie.")
     actors: Optional[List[str]] = Field(None, description="List of main actors in the movie.")
-    
+
+    @field_validator("poster")
+    @classmethod
+    def poster_must_be_http_url(cls, value: Optional[str]) -> Optional[str]:
+        """Keeps only http(s) URLs; placeholders such as OMDB's 'N/A' become None."""
+        if value and value.startswith(("http://", "https://")):
+            return value
+        return None
+
     model_config = ConfigDict(
         populate_by_name=True,
-
-        validate_assignment=True,
         json_schema_extra={
             "example": {
                 "title": "Inception",
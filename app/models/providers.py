@@ -0,0 +1,66 @@
+import msgspec
+from typing import List, Optional
+
+
+# Raw payload shapes of the external providers. Only the fields we read are
+# declared, so msgspec skips everything else while decoding. Item fields are
+# optional so one incomplete item never fails the whole response; such items
+# are dropped later, one by one, when validated into Movie.
+
+
+class OMDBSearchItem(msgspec.Struct):
+    """A single item of an OMDB search response."""
+    title: Optional[str] = msgspec.field(default=None, name="Title")
+    year: Optional[str] = msgspec.field(default=None, name="Year")
+    imdb_id: Optional[str] = msgspec.field(default=None, name="imdbID")
+    type: Optional[str] = msgspec.field(default=None, name="Type")
+    poster: Optional[str] = msgspec.field(default=None, name="Poster")
+
+
+class OMDBSearchResponse(msgspec.Struct):
+    """The OMDB search response envelope."""
+    response: str = msgspec.field(name="Response")
+    search: List[OMDBSearchItem] = msgspec.field(default_factory=list, name="Search")
+
+
+class TMDBSearchItem(msgspec.Struct):
+    """A single item of a TMDB search or discover response (movie or tv)."""
+    id: Optional[int] = None
+    title: Optional[str] = None
+    name: Optional[str] = None
+    release_date: Optional[str] = None
+    first_air_date: Optional[str] = None
+    poster_path: Optional[str] = None
+
+
+class TMDBSearchResponse(msgspec.Struct):
+    """The TMDB search/discover response envelope."""
+    results: List[TMDBSearchItem] = msgspec.field(default_factory=list)
+
+
+class TMDBGenre(msgspec.Struct):
+    id: Optional[int] = None
+    name: Optional[str] = None
+
+
+class TMDBGenreList(msgspec.Struct):
+    """The TMDB genre list response."""
+    genres: List[TMDBGenre] = msgspec.field(default_factory=list)
+
+
+class TMDBDetailsGenre(msgspec.Struct):
+    name: Optional[str] = None
+
+
+class TMDBCastMember(msgspec.Struct):
+    name: Optional[str] = None
+
+
+class TMDBCredits(msgspec.Struct):
+    cast: List[TMDBCastMember] = msgspec.field(default_factory=list)
+
+
+class TMDBDetails(msgspec.Struct):
+    """The TMDB details response, with credits appended."""
+    genres: List[TMDBDetailsGenre] = msgspec.field(default_factory=list)
+    credits: TMDBCredits = msgspec.field(default_factory=TMDBCredits)
@@ -1,20 +1,79 @@
 import asyncio
+import inspect
+from functools import lru_cache
 import httpx
-from typing import Literal, Protocol, List, Dict, Any, Optional
-from pydantic import ValidationError
+import msgspec
+from fastapi import Request, Response
+from typing import Callable, Literal, Protocol, List, Dict, Any, Optional, Tuple, Coroutine
+from pydantic import TypeAdapter, ValidationError
 
 from fastapi_cache.decorator import cache
 
 
 from app.models.movie import Movie
-from app.core.config import get_settings
 from app.core.exceptions import ServiceUnavailable
 
 from app.models.movie import Movie, MovieType
-from app.core.config import get_settings
+from app.models.providers import OMDBSearchResponse, TMDBSearchItem, TMDBSearchResponse, TMDBGenreList, TMDBDetails
 from app.core.exceptions import ServiceUnavailable
 
 
+_MOVIE_LIST_ADAPTER = TypeAdapter(List[Movie])
+
+# Typed decoders straight from response bytes; unused provider fields are skipped.
+_OMDB_SEARCH_DECODER = msgspec.json.Decoder(OMDBSearchResponse)
+_TMDB_SEARCH_DECODER = msgspec.json.Decoder(TMDBSearchResponse)
+_TMDB_GENRE_LIST_DECODER = msgspec.json.Decoder(TMDBGenreList)
+_TMDB_DETAILS_DECODER = msgspec.json.Decoder(TMDBDetails)
+
+
+def _validate_movies(movies_data: List[Dict[str, Any]], service_name: str) -> List[Movie]:
+    """
+    Validates a whole batch of provider items in one call.
+    Items that fail validation are reported and dropped, the rest are kept.
+    """
+    try:
+        return _MOVIE_LIST_ADAPTER.validate_python(movies_data)
+    except ValidationError as e:
+        invalid: Dict[int, List[str]] = {}
+        for error in e.errors():
+            invalid.setdefault(error["loc"][0], []).append(error["msg"])
+        for index, messages in invalid.items():
+            item = movies_data[index]
+            print(f"{service_name} validation error for {item.get('title')}: {messages}")
+        valid_data = [item for index, item in enumerate(movies_data) if index not in invalid]
+        return _MOVIE_LIST_ADAPTER.validate_python(valid_data)
+
+
+@lru_cache(maxsize=None)
+def _parameter_names(func: Callable[..., Any]) -> Tuple[str, ...]:
+    """Parameter names of a function, computed once per function."""
+    return tuple(inspect.signature(func).parameters)
+
+
+def _tmdb_key_builder(kind: str, *params: str) -> Callable[..., str]:
+    """
+    Builds a cache key builder for a TMDBService helper that keys on the given
+    parameters only, ignoring the service and client instances.
+    Parameters are read by name whether they were passed positionally or by keyword.
+    """
+    def key_builder(
+        func: Callable[..., Any],
+        namespace: str = "",
+        *,
+        request: Optional[Request] = None,
+        response: Optional[Response] = None,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        arguments = {**dict(zip(_parameter_names(func), args)), **kwargs}
+        return ":".join([namespace, "tmdb", kind, *(str(arguments[param]) for param in params)])
+    return key_builder
+
+
+_details_key_builder = _tmdb_key_builder("details", "search_type", "item_id")
+_genre_ids_key_builder = _tmdb_key_builder("genres", "search_type")
+
 
 class MovieSearchService(Protocol):
     """
@@ -28,8 +87,9 @@ class MovieSearchService(Protocol):
 
 
 class OMDBService:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client: httpx.AsyncClient):
         self.api_key = api_key
+        self.client = client
         self.base_url = "http://www.omdbapi.com/"
 
     async def search(self, query: str, movie_type: Optional[MovieType] = None) -> List[Movie]:
@@ -38,142 +98,193 @@ class OMDBService:
         if movie_type:
             params["type"] = movie_type.value
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(self.base_url, params=params, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-
-                if data.get("Response") == "True":
-                    movies_data = data.get("Search", [])
-                    validated_movies = []
-                    for movie_data in movies_data:
-                        try:
-                            movie_data['source_api'] = 'OMDB'
-                            movie_data['genres'] = []
-                            movie_data['actors'] = []
-                            validated_movies.append(Movie(**movie_data))
-                        except ValidationError as e:
-                            print(f"OMDB validation error for {movie_data.get('Title')}: {e}")
-                    return validated_movies
-                else:
-                    return []
-            except httpx.HTTPStatusError as e:
-                raise ServiceUnavailable(
-                    service_name="OMDB",
-                    status_code=e.response.status_code,
-                    detail=str(e)
-                )
-            except Exception as e:
-                raise ServiceUnavailable(
-                    service_name="OMDB",
-                    status_code=500,
-                    detail=str(e)
-                )
+        try:
+            response = await self.client.get(self.base_url, params=params, headers=headers)
+            response.raise_for_status()
+            data = _OMDB_SEARCH_DECODER.decode(response.content)
+
+            if data.response == "True":
+                movies_data = [
+                    {
+                        "imdb_id": item.imdb_id,
+                        "title": item.title,
+                        "year": item.year,
+                        "type": item.type,
+                        "poster": item.poster,
+                        "source_api": "OMDB",
+                        "genres": [],
+                        "actors": []
+                    }
+                    for item in data.search
+                ]
+                return _validate_movies(movies_data, "OMDB")
+            else:
+                return []
+        except httpx.HTTPStatusError as e:
+            raise ServiceUnavailable(
+                service_name="OMDB",
+                status_code=e.response.status_code,
+                detail=str(e)
+            )
+        except Exception as e:
+            raise ServiceUnavailable(
+                service_name="OMDB",
+                status_code=500,
+                detail=str(e)
+            )
 
 
 class TMDBService:
-    def __init__(self, api_key: str):
+    # Only the top results of each search get a details lookup.
+    MAX_RESULTS_PER_TYPE = 10
+
+    def __init__(self, api_key: str, client: httpx.AsyncClient):
         self.api_key = api_key
+        self.client = client
         self.base_url = "https://api.themoviedb.org/3"
+        # Caps concurrent details lookups to stay under TMDB's rate limit.
+        self._details_semaphore = asyncio.Semaphore(8)
 
-    @cache(expire=86400) 
+    @cache(expire=86400, key_builder=_details_key_builder)
     async def _get_details(self, client: httpx.AsyncClient, item_id: int, search_type: Literal["movie", "tv"]) -> Dict:
         """Fetches full details including genres and actors for a single item."""
 
         details_url = f"{self.base_url}/{search_type}/{item_id}"
-        credits_url = f"{self.base_url}/{search_type}/{item_id}/credits"
-        params = {"api_key": self.api_key}
+        # Credits are embedded in the details payload, one request per item.
+        params = {"api_key": self.api_key, "append_to_response": "credits"}
 
-        details_task = client.get(details_url, params=params)
-        credits_task = client.get(credits_url, params=params)
-        
-        details_response, credits_response = await asyncio.gather(details_task, credits_task)
+        async with self._details_semaphore:
+            details_response = await client.get(details_url, params=params)
 
         details_response.raise_for_status()
-        credits_response.raise_for_status()
-
-        details_data = details_response.json()
-        credits_data = credits_response.json()
+        details_data = _TMDB_DETAILS_DECODER.decode(details_response.content)
 
-        genres = [genre['name'] for genre in details_data.get('genres', [])]
-        actors = [actor['name'] for actor in credits_data.get('cast', [])[:5]] 
+        genres = [genre.name for genre in details_data.genres if genre.name]
+        actors = [actor.name for actor in details_data.credits.cast if actor.name][:5]
 
         return {"genres": genres, "actors": actors}
 
     
-    async def _search_single_type(self, client: httpx.AsyncClient, query: str, search_type: Literal["movie", "tv"]) -> List[Movie]:
-        """Searches for a single content type and enriches results with details."""
+    def _results_and_details(self, client: httpx.AsyncClient, response: httpx.Response, search_type: Literal["movie", "tv"]) -> Tuple[List[TMDBSearchItem], List[Coroutine[Any, Any, Dict]]]:
+        """
+        Decodes a TMDB search/discover response into its top results (items
+        without an id are skipped) and the matching, not yet awaited, details coroutines.
+        """
+        response.raise_for_status()
+        results = _TMDB_SEARCH_DECODER.decode(response.content).results
+        search_results = [item for item in results if item.id is not None][:self.MAX_RESULTS_PER_TYPE]
+
+        details_coros = [self._get_details(client, item.id, search_type) for item in search_results]
+        return search_results, details_coros
+
+    async def _search_single_type(self, client: httpx.AsyncClient, query: str, search_type: Literal["movie", "tv"]) -> Tuple[List[TMDBSearchItem], List[Coroutine[Any, Any, Dict]]]:
+        """
+        Searches for a single content type.
+        Returns the raw search results together with the (not yet awaited)
+        details coroutines, so the caller decides when to fan them out.
+        """
         endpoint = f"/search/{search_type}"
         search_url = f"{self.base_url}{endpoint}"
         params = {"api_key": self.api_key, "query": query}
         headers = {"User-Agent": "MovieSearchApp/1.0"}
 
         response = await client.get(search_url, params=params, headers=headers)
+        return self._results_and_details(client, response, search_type)
+
+    @cache(expire=86400, key_builder=_genre_ids_key_builder)
+    async def _get_genre_ids(self, client: httpx.AsyncClient, search_type: Literal["movie", "tv"]) -> Dict[str, int]:
+        """Fetches the TMDB genre list for a content type as a lowercase name -> id mapping."""
+        genres_url = f"{self.base_url}/genre/{search_type}/list"
+        params = {"api_key": self.api_key}
+
+        response = await client.get(genres_url, params=params)
         response.raise_for_status()
-        search_results = response.json().get("results", [])
-
-        if not search_results:
-            return []
-
-        details_tasks = [self._get_details(client, item['id'], search_type) for item in search_results]
-        details_list = await asyncio.gather(*details_tasks)
-
-        validated_movies = []
-        for i, item_data in enumerate(search_results):
-            try:
-                is_series = search_type == "tv"
-                item_details = details_list[i]
-
-                mapped_data = {
-                    "imdb_id": f"tmdb_{item_data.get('id')}",
-                    "title": item_data.get("name" if is_series else "title"),
-                    "year": (item_data.get("first_air_date" if is_series else "release_date", "N/A") or "N/A").split('-')[0],
-                    "type": "series" if is_series else "movie",
-                    "poster": f"https://image.tmdb.org/t/p/w500{item_data.get('poster_path')}" if item_data.get('poster_path') else None,
-                    "source_api": "TMDB",
-                    "genres": item_details.get("genres"),
-                    "actors": item_details.get("actors")
-                }
-                validated_movies.append(Movie(**mapped_data))
-            except ValidationError as e:
-                print(f"TMDB validation error for {item_data.get('title') or item_data.get('name')}: {e}")
-        return validated_movies
+        genres = _TMDB_GENRE_LIST_DECODER.decode(response.content).genres
+        return {genre.name.lower(): genre.id for genre in genres if genre.name and genre.id is not None}
 
-    async def search(self, query: str, movie_type: Optional[MovieType] = None) -> List[Movie]:
-        async with httpx.AsyncClient() as client:
-            tasks = []
-            try:
-                if movie_type == MovieType.MOVIE:
-                    tasks.append(self._search_single_type(client, query, "movie"))
-                elif movie_type == MovieType.SERIES:
-                    tasks.append(self._search_single_type(client, query, "tv"))
-                else:
-                    tasks.append(self._search_single_type(client, query, "movie"))
-                    tasks.append(self._search_single_type(client, query, "tv"))
-
-                results_from_tasks: List[List[Movie]] = await asyncio.gather(*tasks)
-                
-                all_results = [movie for sublist in results_from_tasks for movie in sublist]
-                return all_results
-                
-            except httpx.HTTPStatusError as e:
-                raise ServiceUnavailable(
-                    service_name="TMDB",
-                    status_code=e.response.status_code,
-                    detail=str(e)
-                )
-            except Exception as e:
-                raise ServiceUnavailable(
-                    service_name="TMDB",
-                    status_code=500,
-                    detail=str(e)
-                )
-
-def get_omdb_service() -> OMDBService:
-    settings = get_settings()
-    return OMDBService(api_key=settings.OMDB_API_KEY)
-
-def get_tmdb_service() -> TMDBService:
-    settings = get_settings()
-    return TMDBService(api_key=settings.TMDB_API_KEY)
+    async def _discover_single_type(self, client: httpx.AsyncClient, genre: str, search_type: Literal["movie", "tv"]) -> Tuple[List[TMDBSearchItem], List[Coroutine[Any, Any, Dict]]]:
+        """
+        Same as _search_single_type, but lists a single content type by genre
+        through TMDB's /discover endpoint instead of a text search.
+        """
+        genre_ids = await self._get_genre_ids(client, search_type)
+        genre_id = genre_ids.get(genre.lower())
+        if genre_id is None:
+            return [], []
+
+        discover_url = f"{self.base_url}/discover/{search_type}"
+        params = {"api_key": self.api_key, "with_genres": genre_id}
+        headers = {"User-Agent": "MovieSearchApp/1.0"}
+
+        response = await client.get(discover_url, params=params, headers=headers)
+        return self._results_and_details(client, response, search_type)
+
+    async def _fetch_single_type(self, client: httpx.AsyncClient, query: str, genre: Optional[str], search_type: Literal["movie", "tv"]) -> List[Movie]:
+        """Runs the search (or discover) for one content type and fetches its details as soon as it returns."""
+        if genre:
+            search_results, details_coros = await self._discover_single_type(client, genre, search_type)
+        else:
+            search_results, details_coros = await self._search_single_type(client, query, search_type)
+        details_list = await asyncio.gather(*details_coros)
+        return self._to_movies(search_results, details_list, search_type)
+
+    def _to_movies(self, search_results: List[TMDBSearchItem], details_list: List[Dict], search_type: Literal["movie", "tv"]) -> List[Movie]:
+        """Maps raw TMDB search results and their details onto Movie models."""
+        is_series = search_type == "tv"
+        mapped_data = [
+            {
+                "imdb_id": f"tmdb_{item_data.id}",
+                "title": item_data.name if is_series else item_data.title,
+                "year": ((item_data.first_air_date if is_series else item_data.release_date) or "N/A").split('-')[0],
+                "type": "series" if is_series else "movie",
+                "poster": f"https://image.tmdb.org/t/p/w500{item_data.poster_path}" if item_data.poster_path else None,
+                "source_api": "TMDB",
+                "genres": item_details.get("genres"),
+                "actors": item_details.get("actors")
+            }
+            for item_data, item_details in zip(search_results, details_list)
+        ]
+        return _validate_movies(mapped_data, "TMDB")
+
+    async def search(self, query: str, movie_type: Optional[MovieType] = None, genre: Optional[str] = None) -> List[Movie]:
+        """
+        Searches TMDB by text query.
+        When a genre is given, results are listed by genre via /discover instead.
+        """
+        client = self.client
+        if movie_type == MovieType.MOVIE:
+            search_types: List[Literal["movie", "tv"]] = ["movie"]
+        elif movie_type == MovieType.SERIES:
+            search_types = ["tv"]
+        else:
+            search_types = ["movie", "tv"]
+
+        try:
+            # Each content type runs as its own task, so its details fan-out
+            # starts as soon as its search returns instead of waiting for the slowest search.
+            tasks = [asyncio.create_task(self._fetch_single_type(client, query, genre, t)) for t in search_types]
+            results_from_tasks: List[List[Movie]] = await asyncio.gather(*tasks)
+
+            all_results = [movie for sublist in results_from_tasks for movie in sublist]
+            return all_results
+
+        except httpx.HTTPStatusError as e:
+            raise ServiceUnavailable(
+                service_name="TMDB",
+                status_code=e.response.status_code,
+                detail=str(e)
+            )
+        except Exception as e:
+            raise ServiceUnavailable(
+                service_name="TMDB",
+                status_code=500,
+                detail=str(e)
+            )
+
+def get_omdb_service(request: Request) -> OMDBService:
+    """Returns the OMDBService instance created at application startup."""
+    return request.app.state.omdb
+
+def get_tmdb_service(request: Request) -> TMDBService:
+    """Returns the TMDBService instance created at application startup."""
+    return request.app.state.tmdb
@@ -0,0 +1,18 @@
+import pytest
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+
+@pytest.fixture(autouse=True)
+async def init_cache():
+    """
+    Fixture to initialize the cache for each test and clear it afterwards.
+    The in-memory backend's store is shared between instances, so without
+    clearing, cached entries would leak from one test into the next.
+    'autouse=True' means it runs automatically for every test.
+    """
+    FastAPICache.init(InMemoryBackend(), prefix="pytest-cache")
+    yield
+    await FastAPICache.clear()
+    FastAPICache.reset()
@@ -1,21 +1,27 @@
 import pytest
+import httpx
 from httpx import AsyncClient, ASGITransport
 from fastapi import status
 
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.inmemory import InMemoryBackend
-
 from app.main import app
+from app.api.endpoints.movies import search_key_builder, search_movies
+from app.models.movie import MovieType
+from app.core.config import get_settings
+from app.services.movie_service import OMDBService, TMDBService
 
 @pytest.fixture(autouse=True)
-async def init_cache():
+async def init_services():
     """
-    Fixture to initialize and shut down the cache for each test session.
-    'autouse=True' means it runs automatically for every test.
+    Fixture to provide the shared outgoing HTTP client and the provider
+    services, which the app normally creates in its lifespan
+    (not run by ASGITransport). Dummy keys keep tests that never reach
+    the providers independent of real credentials.
     """
-    FastAPICache.init(InMemoryBackend(), prefix="pytest-cache")
+    app.state.http = httpx.AsyncClient()
+    app.state.omdb = OMDBService(api_key="test-key", client=app.state.http)
+    app.state.tmdb = TMDBService(api_key="test-key", client=app.state.http)
     yield
-    FastAPICache.reset()
+    await app.state.http.aclose()
 
 
 @pytest.mark.asyncio
@@ -33,7 +39,11 @@ async def test_read_root():
 async def test_search_movies_success():
     """
     Test a successful movie search by title.
+    This test calls the real providers, so it needs the API keys from settings.
     """
+    settings = get_settings()
+    app.state.omdb = OMDBService(api_key=settings.OMDB_API_KEY, client=app.state.http)
+    app.state.tmdb = TMDBService(api_key=settings.TMDB_API_KEY, client=app.state.http)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         response = await ac.get("/movies/search?title=Matrix")
 
@@ -54,3 +64,54 @@ async def test_search_movies_requires_parameter():
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "must be provided" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_search_by_actor_and_genre_lists_tmdb_by_genre():
+    """
+    Test that without a title, TMDB is listed by genre through /discover
+    (not a text search for the actor), and the actor filter is applied afterwards.
+    """
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url)
+        path = request.url.path
+        if request.url.host == "www.omdbapi.com":
+            return httpx.Response(200, json={"Response": "False", "Error": "Movie not found!"})
+        if path.startswith("/3/genre/"):
+            return httpx.Response(200, json={"genres": [{"id": 28, "name": "Action"}]})
+        if path.startswith("/3/discover/"):
+            return httpx.Response(200, json={"results": [
+                {"id": 1, "title": "Speed", "release_date": "1994-06-10"},
+                {"id": 2, "title": "Die Hard", "release_date": "1988-07-15"},
+            ]})
+        cast = [{"name": "Keanu Reeves"}] if path.endswith("/1") else [{"name": "Bruce Willis"}]
+        return httpx.Response(200, json={"genres": [{"name": "Action"}], "credits": {"cast": cast}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        app.state.omdb = OMDBService(api_key="test-key", client=client)
+        app.state.tmdb = TMDBService(api_key="test-key", client=client)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.get("/movies/search", params={"actor": "keanu reeves", "genre": "Action", "type": "movie"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [movie["Title"] for movie in response.json()["search_results"]] == ["Speed"]
+    assert any(url.path == "/3/discover/movie" and url.params["with_genres"] == "28" for url in requested)
+    assert not any(url.path.startswith("/3/search/") for url in requested)
+    assert any(url.host == "www.omdbapi.com" and url.params["s"] == "keanu reeves" for url in requested)
+
+
+def test_search_cache_key_is_normalized():
+    """
+    Test that the search cache key ignores title case and whitespace and
+    never includes the injected service objects.
+    """
+    omdb_service, tmdb_service = app.state.omdb, app.state.tmdb
+    services = {"omdb_service": omdb_service, "tmdb_service": tmdb_service}
+
+    upper = search_key_builder(search_movies, "ns", args=(), kwargs={"title": "Matrix", "type": MovieType.MOVIE, "actor": None, "genre": "Action", **services})
+    lower = search_key_builder(search_movies, "ns", args=(), kwargs={"title": " matrix ", "type": MovieType.MOVIE, "actor": None, "genre": "action", **services})
+
+    assert upper == lower == "ns:mv:matrix:movie::action"
+    assert repr(omdb_service) not in upper and repr(tmdb_service) not in upper
@@ -0,0 +1,52 @@
+import asyncio
+
+import hishel
+import httpx
+import pytest
+from redis import asyncio as aioredis
+
+from app.core.http_cache import FailSafeRedisStorage
+from app.core.redis_client import create_redis_client
+
+
+def _cache_client(redis: aioredis.Redis) -> hishel.AsyncCacheClient:
+    return hishel.AsyncCacheClient(
+        storage=FailSafeRedisStorage(client=redis, ttl=60),
+        controller=hishel.Controller(cacheable_methods=["GET"], force_cache=True),
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True})),
+    )
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_is_a_cache_miss():
+    """
+    Test that requests still go through when the HTTP cache's Redis is down.
+    """
+    client = _cache_client(create_redis_client("redis://127.0.0.1:1"))
+
+    response = await client.get("http://provider.test/search")
+    await client.aclose()
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_hanging_redis_is_a_cache_miss():
+    """
+    Test that a Redis server which accepts connections but never replies
+    only delays requests by the socket timeout instead of hanging them.
+    """
+    async def never_reply(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.read()
+
+    server = await asyncio.start_server(never_reply, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = _cache_client(create_redis_client(f"redis://127.0.0.1:{port}"))
+
+    response = await asyncio.wait_for(client.get("http://provider.test/search"), timeout=5)
+    await client.aclose()
+    server.close()
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
@@ -0,0 +1,24 @@
+import pytest
+
+from app.models.movie import Movie
+
+
+def _movie(poster):
+    return Movie(imdb_id="tt1", title="Inception", year="2010", type="movie", source_api="OMDB", poster=poster)
+
+
+@pytest.mark.parametrize("poster", ["http://example.com/poster.jpg", "https://example.com/poster.jpg"])
+def test_poster_keeps_http_urls(poster):
+    """
+    Test that http(s) poster URLs are kept as plain strings.
+    """
+    assert _movie(poster).poster == poster
+
+
+@pytest.mark.parametrize("poster", ["N/A", "", None])
+def test_poster_placeholder_becomes_none(poster):
+    """
+    Test that OMDB's 'N/A' placeholder (and other non-URL values) keep the
+    movie but leave it without a poster.
+    """
+    assert _movie(poster).poster is None
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from app.core.redis_client import create_redis_client
+
+
+async def _read_command(reader: asyncio.StreamReader) -> list:
+    """Reads one RESP array command sent by redis-py."""
+    header = await reader.readline()
+    if not header:
+        return []
+    command = []
+    for _ in range(int(header[1:])):
+        length = int((await reader.readline())[1:])
+        command.append((await reader.readexactly(length + 2))[:-2])
+    return command
+
+
+@pytest.fixture
+async def slow_redis():
+    """A minimal Redis stand-in that answers every GET with a miss after 10ms."""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while command := await _read_command(reader):
+            if command[0].upper() == b"GET":
+                await asyncio.sleep(0.01)
+                writer.write(b"$-1\r\n")
+            else:
+                writer.write(b"+OK\r\n")
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"redis://127.0.0.1:{port}"
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_waits_for_free_connection(slow_redis):
+    """
+    Test that more concurrent commands than pooled connections wait for
+    a free connection instead of failing with 'Too many connections'.
+    """
+    redis = create_redis_client(slow_redis, max_connections=5)
+
+    results = await asyncio.gather(*(redis.get(f"key-{i}") for i in range(30)))
+    await redis.aclose()
+
+    assert results == [None] * 30
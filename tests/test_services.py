@@ -0,0 +1,199 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.models.movie import MovieType
+from app.services.movie_service import OMDBService, TMDBService, _details_key_builder, _validate_movies
+
+
+TMDB_GENRES = {
+    "movie": [{"id": 28, "name": "Action"}, {"id": 18, "name": "Drama"}],
+    "tv": [{"id": 10759, "name": "Action & Adventure"}, {"id": 18, "name": "Drama"}],
+}
+
+
+def tmdb_handler(requested_paths):
+    """Builds a mock TMDB transport handler that records every requested path."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requested_paths.append(path)
+        if path.startswith("/3/genre/"):
+            return httpx.Response(200, json={"genres": TMDB_GENRES[path.split("/")[3]]})
+        if path.startswith("/3/discover/"):
+            genre_id = request.url.params["with_genres"]
+            return httpx.Response(200, json={"results": [
+                {"id": int(genre_id), "title": f"Movie {genre_id}", "name": f"Show {genre_id}", "release_date": "1994-06-10", "first_air_date": "2001-01-01"}
+            ]})
+        return httpx.Response(200, json={"genres": [{"name": "Drama"}], "credits": {"cast": [{"name": "Keanu Reeves"}]}})
+    return handler
+
+
+def test_validate_movies_drops_only_invalid_items():
+    """
+    Test that a batch with one invalid item keeps every valid item
+    and drops only the invalid one.
+    """
+    movies_data = [
+        {"imdb_id": "tt1", "title": "Good One", "year": "1999", "type": "movie", "source_api": "OMDB"},
+        {"imdb_id": "tt2", "title": "Bad Type", "year": "1999", "type": "podcast", "source_api": "OMDB"},
+        {"imdb_id": "tt3", "title": "Good Two", "year": "2003", "type": "series", "source_api": "OMDB"},
+    ]
+
+    movies = _validate_movies(movies_data, "OMDB")
+
+    assert [movie.imdb_id for movie in movies] == ["tt1", "tt3"]
+
+
+def test_details_key_builder_accepts_keyword_arguments():
+    """
+    Test that the TMDB details cache key only depends on content type and id,
+    whether they are passed positionally or by keyword.
+    """
+    service = TMDBService(api_key="test-key", client=None)
+    func = TMDBService._get_details.__wrapped__
+
+    positional = _details_key_builder(func, "ns", args=(service, None, 603, "movie"), kwargs={})
+    keyword = _details_key_builder(func, "ns", args=(service,), kwargs={"client": None, "item_id": 603, "search_type": "movie"})
+
+    assert positional == keyword == "ns:tmdb:details:movie:603"
+
+
+@pytest.mark.asyncio
+async def test_discover_unknown_genre_returns_no_results():
+    """
+    Test that a genre TMDB does not know yields no results and no /discover call.
+    """
+    requested_paths = []
+    async with httpx.AsyncClient(transport=httpx.MockTransport(tmdb_handler(requested_paths))) as client:
+        service = TMDBService(api_key="test-key", client=client)
+        movies = await service.search("Western", genre="Western")
+
+    assert movies == []
+    assert not any(path.startswith("/3/discover/") for path in requested_paths)
+
+
+@pytest.mark.asyncio
+async def test_discover_skips_type_without_matching_genre_name():
+    """
+    Test that a genre named differently for TV ('Action & Adventure')
+    only lists movies, while a genre shared by both types lists both.
+    """
+    requested_paths = []
+    async with httpx.AsyncClient(transport=httpx.MockTransport(tmdb_handler(requested_paths))) as client:
+        service = TMDBService(api_key="test-key", client=client)
+        action = await service.search("Action", genre="action")
+        action_paths = list(requested_paths)
+        drama = await service.search("Drama", genre="Drama")
+
+    assert [(movie.title, movie.type) for movie in action] == [("Movie 28", "movie")]
+    assert "/3/discover/tv" not in action_paths
+    assert sorted(movie.type for movie in drama) == ["movie", "series"]
+
+
+@pytest.mark.asyncio
+async def test_omdb_search_drops_only_malformed_items():
+    """
+    Test that an OMDB item with a missing Year or a null Title is dropped
+    without failing the rest of the search.
+    """
+    payload = {"Response": "True", "Search": [
+        {"Title": "The Matrix", "Year": "1999", "imdbID": "tt0133093", "Type": "movie", "Poster": "N/A"},
+        {"Title": "NoYear", "imdbID": "tt3", "Type": "movie"},
+        {"Title": None, "Year": "2003", "imdbID": "tt4", "Type": "movie"},
+    ]}
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    async with httpx.AsyncClient(transport=transport) as client:
+        movies = await OMDBService(api_key="test-key", client=client).search("matrix")
+
+    assert [movie.imdb_id for movie in movies] == ["tt0133093"]
+
+
+@pytest.mark.asyncio
+async def test_tmdb_details_skip_unnamed_genres_and_cast():
+    """
+    Test that TMDB genres or cast members without a name are skipped
+    instead of failing the whole TMDB search.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/3/search/"):
+            return httpx.Response(200, json={"results": [{"id": 603, "title": "The Matrix", "release_date": "1999-03-30"}, {"title": "No id"}]})
+        return httpx.Response(200, json={
+            "genres": [{"name": None}, {"name": "Action"}],
+            "credits": {"cast": [{"name": None}, {"name": "Keanu Reeves"}]},
+        })
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        movies = await TMDBService(api_key="test-key", client=client).search("matrix", movie_type=MovieType.MOVIE)
+
+    assert [(movie.imdb_id, movie.genres, movie.actors) for movie in movies] == [("tmdb_603", ["Action"], ["Keanu Reeves"])]
+
+
+@pytest.mark.asyncio
+async def test_tmdb_details_concurrency_is_capped():
+    """
+    Test that no more than 8 TMDB details requests are in flight at once,
+    even when a movie + tv search fans out to 20 details lookups.
+    """
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        if request.url.path.startswith("/3/search/"):
+            return httpx.Response(200, json={"results": [{"id": i, "title": f"Movie {i}", "name": f"Show {i}"} for i in range(1, 11)]})
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"genres": [], "credits": {"cast": []}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        movies = await TMDBService(api_key="test-key", client=client).search("matrix")
+
+    assert len(movies) == 20
+    assert 1 < peak <= 8
+
+
+@pytest.mark.asyncio
+async def test_tmdb_details_fetch_credits_in_one_request():
+    """
+    Test that each item's details and credits come from a single
+    append_to_response=credits request, with no separate /credits call.
+    """
+    details_urls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/3/search/"):
+            return httpx.Response(200, json={"results": [{"id": 603, "title": "The Matrix"}, {"id": 604, "title": "The Matrix Reloaded"}]})
+        details_urls.append(request.url)
+        return httpx.Response(200, json={"genres": [{"name": "Action"}], "credits": {"cast": [{"name": "Keanu Reeves"}]}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        movies = await TMDBService(api_key="test-key", client=client).search("matrix", movie_type=MovieType.MOVIE)
+
+    assert sorted(url.path for url in details_urls) == ["/3/movie/603", "/3/movie/604"]
+    assert all(url.params["append_to_response"] == "credits" for url in details_urls)
+    assert [movie.actors for movie in movies] == [["Keanu Reeves"], ["Keanu Reeves"]]
+
+
+@pytest.mark.asyncio
+async def test_tmdb_details_only_for_top_results():
+    """
+    Test that a full 20-item TMDB page only gets details lookups (and
+    results) for its top MAX_RESULTS_PER_TYPE items.
+    """
+    details_paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/3/search/"):
+            return httpx.Response(200, json={"results": [{"id": i, "title": f"Movie {i}"} for i in range(1, 21)]})
+        details_paths.append(request.url.path)
+        return httpx.Response(200, json={"genres": [], "credits": {"cast": []}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        movies = await TMDBService(api_key="test-key", client=client).search("movie", movie_type=MovieType.MOVIE)
+
+    assert TMDBService.MAX_RESULTS_PER_TYPE == 10
+    assert sorted(details_paths) == sorted(f"/3/movie/{i}" for i in range(1, 11))
+    assert [movie.imdb_id for movie in movies] == [f"tmdb_{i}" for i in range(1, 11)]